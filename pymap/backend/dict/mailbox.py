@@ -18,8 +18,8 @@ from pymap.mailbox import MailboxSnapshot
 from pymap.message import BaseMessage, BaseLoadedMessage
 from pymap.mime import MessageContent
 from pymap.parsing.message import AppendMessage
-from pymap.parsing.specials import ObjectId, FetchRequirement
-from pymap.parsing.specials.flag import Flag, Seen
+from pymap.parsing.specials import ObjectId, FetchRequirement, SequenceSet
+from pymap.parsing.specials.flag import Flag, Deleted, Seen
 from pymap.selected import SelectedSet, SelectedMailbox
 from pymap.threads import ThreadKey
 
@@ -239,51 +239,86 @@ class MailboxData(MailboxDataInterface[Message]):
 
     async def append(self, append_msg: AppendMessage, *,
                      recent: bool = False) -> Message:
-        when = append_msg.when or datetime.now()
-        content = MessageContent.parse(append_msg.literal)
-        email_id = self._content_cache.add(content)
-        thread_id = self._thread_cache.add(content)
+        messages = await self.append_all([append_msg], recent=recent)
+        return messages[0]
+
+    async def append_all(self, append_msgs: Iterable[AppendMessage], *,
+                         recent: bool = False) -> Sequence[Message]:
+        parsed: list[tuple[AppendMessage, datetime, MessageContent,
+                           ObjectId, ObjectId]] = []
+        for append_msg in append_msgs:
+            when = append_msg.when or datetime.now()
+            content = MessageContent.parse(append_msg.literal)
+            email_id = self._content_cache.add(content)
+            thread_id = self._thread_cache.add(content)
+            parsed.append((append_msg, when, content, email_id, thread_id))
+        if not parsed:
+            return []
+        ret: list[Message] = []
         async with self.messages_lock.write_lock():
-            self._max_uid = new_uid = self._max_uid + 1
-            message = Message(new_uid, when, append_msg.flag_set,
-                              email_id=email_id, thread_id=thread_id,
-                              recent=recent, content=content)
-            self._messages[new_uid] = message
-            self._mod_sequences.update([new_uid])
+            for append_msg, when, content, email_id, thread_id in parsed:
+                self._max_uid = new_uid = self._max_uid + 1
+                message = Message(new_uid, when, append_msg.flag_set,
+                                  email_id=email_id, thread_id=thread_id,
+                                  recent=recent, content=content)
+                self._messages[new_uid] = message
+                ret.append(message)
+            self._mod_sequences.update([msg.uid for msg in ret])
             self._updated.set()
-            return message
+        return ret
 
     async def copy(self, uid: int, destination: MailboxData, *,
                    recent: bool = False) -> Optional[int]:
+        copied = await self.copy_all([uid], destination, recent=recent)
+        return copied[0][1] if copied else None
+
+    async def copy_all(self, uids: Iterable[int], destination: MailboxData,
+                       *, recent: bool = False) -> Sequence[tuple[int, int]]:
         async with self.messages_lock.read_lock():
-            try:
-                message = self._messages[uid]
-            except KeyError:
-                return None
+            messages = [msg for msg in map(self._messages.get, uids)
+                        if msg is not None]
+        if not messages:
+            return []
+        ret: list[tuple[int, int]] = []
         async with destination.messages_lock.write_lock():
-            destination._max_uid = dest_uid = destination._max_uid + 1
-            new_msg = Message.copy(message, uid=dest_uid, recent=recent)
-            destination._messages[dest_uid] = new_msg
-            destination._mod_sequences.update([dest_uid])
+            for message in messages:
+                destination._max_uid = dest_uid = destination._max_uid + 1
+                new_msg = Message.copy(message, uid=dest_uid, recent=recent)
+                destination._messages[dest_uid] = new_msg
+                ret.append((message.uid, dest_uid))
+            destination._mod_sequences.update(
+                [dest_uid for _, dest_uid in ret])
             destination._updated.set()
-        return dest_uid
+        return ret
 
     async def move(self, uid: int, destination: MailboxData, *,
                    recent: bool = False) -> Optional[int]:
+        moved = await self.move_all([uid], destination, recent=recent)
+        return moved[0][1] if moved else None
+
+    async def move_all(self, uids: Iterable[int], destination: MailboxData,
+                       *, recent: bool = False) -> Sequence[tuple[int, int]]:
+        messages: list[Message] = []
         async with self.messages_lock.write_lock():
-            try:
-                message = self._messages.pop(uid)
-            except KeyError:
-                return None
-            self._mod_sequences.expunge([uid])
+            for uid in uids:
+                message = self._messages.pop(uid, None)
+                if message is not None:
+                    messages.append(message)
+            if not messages:
+                return []
+            self._mod_sequences.expunge([msg.uid for msg in messages])
             self._updated.set()
+        ret: list[tuple[int, int]] = []
         async with destination.messages_lock.write_lock():
-            destination._max_uid = dest_uid = destination._max_uid + 1
-            new_msg = Message.copy(message, uid=dest_uid, recent=recent)
-            destination._messages[dest_uid] = new_msg
-            destination._mod_sequences.update([dest_uid])
+            for message in messages:
+                destination._max_uid = dest_uid = destination._max_uid + 1
+                new_msg = Message.copy(message, uid=dest_uid, recent=recent)
+                destination._messages[dest_uid] = new_msg
+                ret.append((message.uid, dest_uid))
+            destination._mod_sequences.update(
+                [dest_uid for _, dest_uid in ret])
             destination._updated.set()
-        return dest_uid
+        return ret
 
     async def get(self, uid: int, cached_msg: CachedMessage) -> Message:
         if uid < 1 or uid > self._max_uid:
@@ -299,12 +334,45 @@ class MailboxData(MailboxDataInterface[Message]):
     async def update(self, uid: int, cached_msg: CachedMessage,
                      flag_set: frozenset[Flag], mode: FlagOp) -> Message:
         msg = await self.get(uid, cached_msg)
-        msg.permanent_flags = mode.apply(msg.permanent_flags, flag_set)
-        self._mod_sequences.update([uid])
-        self._updated.set()
+        new_flags = mode.apply(msg.permanent_flags, flag_set)
+        if new_flags != msg.permanent_flags:
+            msg.permanent_flags = new_flags
+            if not msg.expunged:
+                self._mod_sequences.update([uid])
+                self._updated.set()
         return msg
 
+    async def update_all(self, messages: Iterable[CachedMessage],
+                         flag_set: frozenset[Flag], mode: FlagOp) \
+            -> Sequence[Message]:
+        ret: list[Message] = []
+        updated: list[int] = []
+        async with self.messages_lock.read_lock():
+            for cached_msg in messages:
+                uid = cached_msg.uid
+                if uid < 1 or uid > self._max_uid:
+                    raise IndexError(uid)
+                msg = self._messages.get(uid)
+                if msg is None:
+                    if not isinstance(cached_msg, Message):
+                        raise TypeError(cached_msg)
+                    msg = Message.copy(cached_msg, expunged=True)
+                ret.append(msg)
+            for msg in ret:
+                new_flags = mode.apply(msg.permanent_flags, flag_set)
+                if new_flags != msg.permanent_flags:
+                    msg.permanent_flags = new_flags
+                    if not msg.expunged:
+                        updated.append(msg.uid)
+        if updated:
+            self._mod_sequences.update(updated)
+            self._updated.set()
+        return ret
+
     async def delete(self, uids: Iterable[int]) -> None:
+        uids = list(uids)
+        if not uids:
+            return
         async with self.messages_lock.write_lock():
             for uid in uids:
                 try:
@@ -314,39 +382,58 @@ class MailboxData(MailboxDataInterface[Message]):
             self._mod_sequences.expunge(uids)
             self._updated.set()
 
+    async def find_deleted(self, seq_set: SequenceSet,
+                           selected: SelectedMailbox) -> Sequence[int]:
+        session_flags = selected.session_flags
+        uids = [uid for _, uid in selected.messages.get_uids(seq_set)]
+        async with self.messages_lock.read_lock():
+            messages = [self._messages.get(uid) for uid in uids]
+        return [msg.uid for msg in messages if msg is not None
+                and Deleted in msg.get_flags(session_flags)]
+
     async def claim_recent(self, selected: SelectedMailbox) -> None:
         uids: list[int] = []
-        async for msg in self.messages():
-            if msg.recent:
-                msg.recent = False
-                msg_uid = msg.uid
-                selected.session_flags.add_recent(msg_uid)
-                uids.append(msg_uid)
-        self._mod_sequences.update(uids)
-        self._updated.set()
+        async for batch in self.messages_batch():
+            for msg in batch:
+                if msg.recent:
+                    msg.recent = False
+                    msg_uid = msg.uid
+                    selected.session_flags.add_recent(msg_uid)
+                    uids.append(msg_uid)
+        if uids:
+            self._mod_sequences.update(uids)
+            self._updated.set()
 
     async def cleanup(self) -> None:
         pass
 
     async def messages(self) -> AsyncIterable[Message]:
-        async with self.messages_lock.read_lock():
-            for msg in self._messages.values():
+        async for batch in self.messages_batch():
+            for msg in batch:
                 yield msg
 
+    async def messages_batch(self, size: int = 512) \
+            -> AsyncIterable[Sequence[Message]]:
+        async with self.messages_lock.read_lock():
+            messages = list(self._messages.values())
+            for i in range(0, len(messages), size):
+                yield messages[i:i + size]
+
     async def snapshot(self) -> MailboxSnapshot:
         exists = 0
         recent = 0
         unseen = 0
         first_unseen: Optional[int] = None
         next_uid = self._max_uid + 1
-        async for msg in self.messages():
-            exists += 1
-            if msg.recent:
-                recent += 1
-            if Seen not in msg.permanent_flags:
-                unseen += 1
-                if first_unseen is None:
-                    first_unseen = exists
+        async for batch in self.messages_batch():
+            for msg in batch:
+                exists += 1
+                if msg.recent:
+                    recent += 1
+                if Seen not in msg.permanent_flags:
+                    unseen += 1
+                    if first_unseen is None:
+                        first_unseen = exists
         return MailboxSnapshot(self.mailbox_id, self.readonly,
                                self.uid_validity, self.permanent_flags,
                                self.session_flags, exists, recent, unseen,
@@ -367,25 +454,42 @@ class MailboxSet(MailboxSetInterface[MailboxData]):
         self._set: dict[str, MailboxData] = {}
         self._set_lock = subsystem.get().new_rwlock()
         self._subscribed: dict[str, bool] = {}
+        self._list_cache: Optional[ListTree] = None
+        self._lsub_cache: Optional[ListTree] = None
 
     @property
     def delimiter(self) -> str:
         return '/'
 
+    def _reset_cache(self) -> None:
+        self._list_cache = None
+        self._lsub_cache = None
+
+    def _get_list_tree(self) -> ListTree:
+        tree = self._list_cache
+        if tree is None:
+            tree = ListTree(self.delimiter).update('INBOX', *self._set.keys())
+            self._list_cache = tree
+        return tree
+
     async def set_subscribed(self, name: str, subscribed: bool) -> None:
         async with self._set_lock.write_lock():
             self._subscribed[name] = subscribed
+            self._lsub_cache = None
 
     async def list_subscribed(self) -> ListTree:
         async with self._set_lock.read_lock():
-            mailboxes = [child for child in self._set.keys()
-                         if self._subscribed.get(child)]
-        return ListTree(self.delimiter).update('INBOX', *mailboxes)
+            tree = self._lsub_cache
+            if tree is None:
+                mailboxes = [child for child in self._set.keys()
+                             if self._subscribed.get(child)]
+                tree = ListTree(self.delimiter).update('INBOX', *mailboxes)
+                self._lsub_cache = tree
+            return tree
 
     async def list_mailboxes(self) -> ListTree:
         async with self._set_lock.read_lock():
-            mailboxes = list(self._set.keys())
-        return ListTree(self.delimiter).update('INBOX', *mailboxes)
+            return self._get_list_tree()
 
     async def get_mailbox(self, name: str) -> MailboxData:
         if name.upper() == 'INBOX':
@@ -400,6 +504,7 @@ class MailboxSet(MailboxSetInterface[MailboxData]):
         async with self._set_lock.write_lock():
             self._set[name] = mbx = MailboxData(
                 self._content_cache, self._thread_cache)
+            self._reset_cache()
             return mbx.mailbox_id
 
     async def delete_mailbox(self, name: str) -> None:
@@ -408,10 +513,11 @@ class MailboxSet(MailboxSetInterface[MailboxData]):
                 raise KeyError(name)
         async with self._set_lock.write_lock():
             del self._set[name]
+            self._reset_cache()
 
     async def rename_mailbox(self, before: str, after: str) -> None:
         async with self._set_lock.read_lock():
-            tree = ListTree(self.delimiter).update('INBOX', *self._set.keys())
+            tree = self._get_list_tree()
             before_entry = tree.get(before)
             after_entry = tree.get(after)
             if before_entry is None:
@@ -427,3 +533,4 @@ class MailboxSet(MailboxSetInterface[MailboxData]):
                 else:
                     self._set[after_name] = self._set[before_name]
                     del self._set[before_name]
+            self._reset_cache()
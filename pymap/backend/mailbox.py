@@ -96,6 +96,23 @@ class MailboxDataInterface(Protocol[MessageT_co]):
         """
         ...
 
+    async def append_all(self, append_msgs: Iterable[AppendMessage], *,
+                         recent: bool = False) -> Sequence[MessageT_co]:
+        """Adds all the new messages to the end of the mailbox, returning
+        copies of the messages with their assigned UIDs. Messages are added in
+        the order given, so that the UIDs are assigned in the same order.
+
+        Backends may override this method to add the messages in a single
+        batch operation.
+
+        Args:
+            append_msgs: The new message data.
+            recent: True if the messages should be marked recent.
+
+        """
+        return [await self.append(append_msg, recent=recent)
+                for append_msg in append_msgs]
+
     @abstractmethod
     async def copy(self: MailboxDataT, uid: int, destination: MailboxDataT, *,
                    recent: bool = False) -> Optional[int]:
@@ -110,6 +127,30 @@ class MailboxDataInterface(Protocol[MessageT_co]):
         """
         ...
 
+    async def copy_all(self: MailboxDataT, uids: Iterable[int],
+                       destination: MailboxDataT, *,
+                       recent: bool = False) -> Sequence[tuple[int, int]]:
+        """Copies all the messages that exist from this mailbox to the
+        *destination* mailbox, returning pairs of the source UID and its newly
+        assigned UID. Messages are copied in the order given, so that the new
+        UIDs are assigned in the same order.
+
+        Backends may override this method to copy the messages in a single
+        batch operation.
+
+        Args:
+            uids: The UIDs of the messages to copy.
+            destination: The destination mailbox.
+            recent: True if the messages should be marked recent.
+
+        """
+        ret: list[tuple[int, int]] = []
+        for uid in uids:
+            dest_uid = await self.copy(uid, destination, recent=recent)
+            if dest_uid is not None:
+                ret.append((uid, dest_uid))
+        return ret
+
     @abstractmethod
     async def move(self: MailboxDataT, uid: int, destination: MailboxDataT, *,
                    recent: bool = False) -> Optional[int]:
@@ -124,6 +165,30 @@ class MailboxDataInterface(Protocol[MessageT_co]):
         """
         ...
 
+    async def move_all(self: MailboxDataT, uids: Iterable[int],
+                       destination: MailboxDataT, *,
+                       recent: bool = False) -> Sequence[tuple[int, int]]:
+        """Moves all the messages that exist from this mailbox to the
+        *destination* mailbox, returning pairs of the source UID and its newly
+        assigned UID. Messages are moved in the order given, so that the new
+        UIDs are assigned in the same order.
+
+        Backends may override this method to move the messages in a single
+        batch operation.
+
+        Args:
+            uids: The UIDs of the messages to move.
+            destination: The destination mailbox.
+            recent: True if the messages should be marked recent.
+
+        """
+        ret: list[tuple[int, int]] = []
+        for uid in uids:
+            dest_uid = await self.move(uid, destination, recent=recent)
+            if dest_uid is not None:
+                ret.append((uid, dest_uid))
+        return ret
+
     @abstractmethod
     async def get(self, uid: int, cached_msg: CachedMessage) -> MessageT_co:
         """Return the message with the given UID.
@@ -149,6 +214,24 @@ class MailboxDataInterface(Protocol[MessageT_co]):
         """
         ...
 
+    async def update_all(self, messages: Iterable[CachedMessage],
+                         flag_set: frozenset[Flag], mode: FlagOp) \
+            -> Sequence[MessageT_co]:
+        """Update the permanent flags of all the given messages, returning
+        the updated messages in the same order.
+
+        Backends may override this method to save all the flag changes in a
+        single batch operation.
+
+        Args:
+            messages: The last known cached messages.
+            flag_set: The set of flags for the update operation.
+            mode: The mode to change the flags.
+
+        """
+        return [await self.update(cached_msg.uid, cached_msg, flag_set, mode)
+                for cached_msg in messages]
+
     @abstractmethod
     async def delete(self, uids: Iterable[int]) -> None:
         """Delete messages with the given UIDs.
@@ -186,6 +269,32 @@ class MailboxDataInterface(Protocol[MessageT_co]):
         """Returns a snapshot of the current state of the mailbox."""
         ...
 
+    @abstractmethod
+    def messages(self) -> AsyncIterable[MessageT_co]:
+        """Yields all the messages in the mailbox."""
+        ...
+
+    async def messages_batch(self, size: int = 512) \
+            -> AsyncIterable[Sequence[MessageT_co]]:
+        """Yields all the messages in the mailbox in batches of up to *size*
+        messages, so that callers only suspend once per batch.
+
+        Backends may override this method to load each batch in a single
+        operation.
+
+        Args:
+            size: The maximum number of messages per batch.
+
+        """
+        batch: list[MessageT_co] = []
+        async for msg in self.messages():
+            batch.append(msg)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
     async def find(self, seq_set: SequenceSet, selected: SelectedMailbox) \
             -> AsyncIterable[tuple[int, MessageT_co]]:
         """Find the active message UID and message pairs in the mailbox that
@@ -4,7 +4,7 @@ from __future__ import annotations
 import errno
 import os
 import os.path
-from collections.abc import Iterable, AsyncIterable
+from collections.abc import Iterable, Sequence, AsyncIterable
 from datetime import datetime
 from mailbox import Maildir as _Maildir, MaildirMessage
 from typing import Optional, Union, Final, Literal
@@ -250,7 +250,9 @@ class MailboxData(MailboxDataInterface[Message]):
                               wait_on: Event = None) -> SelectedMailbox:
         if wait_on is not None:
             await wait_on.wait(timeout=1.0)
-        all_messages = [msg async for msg in self.messages()]
+        all_messages: list[Message] = []
+        async for batch in self.messages_batch():
+            all_messages.extend(batch)
         selected.set_messages(all_messages)
         return selected
 
@@ -389,21 +391,35 @@ class MailboxData(MailboxDataInterface[Message]):
                     uidl.set(new_rec)
 
     async def messages(self) -> AsyncIterable[Message]:
+        async for batch in self.messages_batch():
+            for msg in batch:
+                yield msg
+
+    async def messages_batch(self, size: int = 512) \
+            -> AsyncIterable[Sequence[Message]]:
         async with UidList.with_read(self._path) as uidl:
             uids = {rec.uid: rec for rec in uidl.records}
-        maildir = self._maildir
+        records = list(uids.values())
         async with self.messages_lock.read_lock():
-            for uid, rec in uids.items():
-                email_id = self._get_object_id(rec, 'E')
-                thread_id = self._get_object_id(rec, 'T')
-                try:
-                    maildir_msg = maildir.get_message_metadata(rec.key)
-                except (KeyError, FileNotFoundError):
-                    pass
-                else:
-                    yield Message.from_maildir(
-                        uid, maildir_msg, maildir, rec.key,
-                        email_id, thread_id, self.maildir_flags)
+            for i in range(0, len(records), size):
+                yield self._load_messages(records[i:i + size])
+
+    def _load_messages(self, records: Iterable[Record]) -> Sequence[Message]:
+        maildir = self._maildir
+        maildir_flags = self.maildir_flags
+        ret: list[Message] = []
+        for rec in records:
+            email_id = self._get_object_id(rec, 'E')
+            thread_id = self._get_object_id(rec, 'T')
+            try:
+                maildir_msg = maildir.get_message_metadata(rec.key)
+            except (KeyError, FileNotFoundError):
+                pass
+            else:
+                ret.append(Message.from_maildir(
+                    rec.uid, maildir_msg, maildir, rec.key,
+                    email_id, thread_id, maildir_flags))
+        return ret
 
     async def reset(self) -> MailboxData:
         keys = await self._get_keys()
@@ -429,14 +445,15 @@ class MailboxData(MailboxDataInterface[Message]):
         unseen = 0
         first_unseen: Optional[int] = None
         next_uid = self._next_uid
-        async for msg in self.messages():
-            exists += 1
-            if msg.recent:
-                recent += 1
-            if Seen not in msg.permanent_flags:
-                unseen += 1
-                if first_unseen is None:
-                    first_unseen = exists
+        async for batch in self.messages_batch():
+            for msg in batch:
+                exists += 1
+                if msg.recent:
+                    recent += 1
+                if Seen not in msg.permanent_flags:
+                    unseen += 1
+                    if first_unseen is None:
+                        first_unseen = exists
         return MailboxSnapshot(self.mailbox_id, self.readonly,
                                self.uid_validity, self.permanent_flags,
                                self.session_flags, exists, recent, unseen,
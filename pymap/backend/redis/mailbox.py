@@ -1,7 +1,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import AsyncIterable, Iterable, Mapping, Sequence
 from datetime import datetime
 from typing import Optional
 
@@ -157,22 +157,34 @@ class MailboxData(MailboxDataInterface[Message]):
             return Message.copy_expunged(cached_msg)
         return self._get_msg(uid, message_raw)
 
-    async def update(self, uid: int, cached_msg: CachedMessage,
-                     flag_set: frozenset[Flag], mode: FlagOp) -> Message:
-        keys = self._keys
-        ns_keys = self._ns_keys
-        try:
-            message_raw = await _scripts.update(
-                self._redis, ns_keys, keys, uid=uid, mode=bytes(mode),
-                flags=[str(flag) for flag in flag_set])
-        except ResponseError as exc:
-            if 'message not found' not in str(exc):
-                raise
+    def _get_updated(self, uid: int, cached_msg: CachedMessage,
+                     message_raw: Optional[bytes]) -> Message:
+        if message_raw is None:
             if not isinstance(cached_msg, Message):
                 raise TypeError(cached_msg)
             return Message.copy_expunged(cached_msg)
         return self._get_msg(uid, message_raw)
 
+    async def update(self, uid: int, cached_msg: CachedMessage,
+                     flag_set: frozenset[Flag], mode: FlagOp) -> Message:
+        message_raw, = await _scripts.update(
+            self._redis, self._ns_keys, self._keys, uids=[uid],
+            mode=bytes(mode), flags=[str(flag) for flag in flag_set])
+        return self._get_updated(uid, cached_msg, message_raw)
+
+    async def update_all(self, messages: Iterable[CachedMessage],
+                         flag_set: frozenset[Flag], mode: FlagOp) \
+            -> Sequence[Message]:
+        messages = list(messages)
+        if not messages:
+            return []
+        messages_raw = await _scripts.update(
+            self._redis, self._ns_keys, self._keys,
+            uids=[msg.uid for msg in messages],
+            mode=bytes(mode), flags=[str(flag) for flag in flag_set])
+        return [self._get_updated(cached_msg.uid, cached_msg, message_raw)
+                for cached_msg, message_raw in zip(messages, messages_raw)]
+
     async def delete(self, uids: Iterable[int]) -> None:
         keys = self._keys
         ns_keys = self._ns_keys
@@ -193,10 +205,12 @@ class MailboxData(MailboxDataInterface[Message]):
 
     async def find_deleted(self, seq_set: SequenceSet,
                            selected: SelectedMailbox) -> Sequence[int]:
-        if not seq_set.is_all:
-            return await super().find_deleted(seq_set, selected)
         deleted = await self._redis.smembers(self._keys.deleted)
-        return [int(uid) for uid in deleted]
+        if seq_set.is_all:
+            return [int(uid) for uid in deleted]
+        deleted_uids = frozenset(int(uid) for uid in deleted)
+        return [uid for _, uid in selected.messages.get_uids(seq_set)
+                if uid in deleted_uids]
 
     async def cleanup(self) -> None:
         pass
@@ -209,6 +223,11 @@ class MailboxData(MailboxDataInterface[Message]):
                                self.session_flags, num_exists, num_recent,
                                num_unseen, first_unseen, next_uid)
 
+    async def messages(self) -> AsyncIterable[Message]:
+        msg_raw_map = await self._redis.hgetall(self._keys.uids)
+        for uid, msg_raw in msg_raw_map.items():
+            yield self._get_msg(int(uid), msg_raw)
+
     def _get_mod_seq(self, changes: _ChangesRaw) -> Optional[bytes]:
         try:
             ret = changes[-1][0]
@@ -5,17 +5,10 @@ local i, deleted_key = next(KEYS, i)
 local i, unseen_key = next(KEYS, i)
 local i, max_modseq_key = next(KEYS, i)
 
-local uid = tonumber(ARGV[1])
+local uids = cmsgpack.unpack(ARGV[1])
 local mode = ARGV[2]
 local flag_set = cmsgpack.unpack(ARGV[3])
 
-local message_str = redis.call('HGET', uids_key, uid)
-if not message_str then
-    return redis.error_reply('message not found')
-end
-local message = cmsgpack.unpack(message_str)
-local msg_flags = message['flags']
-
 local function to_map(list)
     local map = {}
     for i, v in ipairs(list) do
@@ -32,69 +25,97 @@ local function to_list(map)
     return list
 end
 
+local function same_flags(left, right)
+    if #left ~= #right then
+        return false
+    end
+    local left_map = to_map(left)
+    for i, flag in ipairs(right) do
+        if not left_map[flag] then
+            return false
+        end
+    end
+    return true
+end
+
 local flag_set_map = to_map(flag_set)
 local has_deleted = flag_set_map['\\Deleted']
 local has_seen = flag_set_map['\\Seen']
-local new_flags = nil
 
-if mode == 'ADD' and next(flag_set) then
-    local new_flags_map = {}
-    for i, flag in ipairs(msg_flags) do
-        new_flags_map[flag] = true
-    end
-    for i, flag in ipairs(flag_set) do
-        new_flags_map[flag] = true
+local function update(uid)
+    local message_str = redis.call('HGET', uids_key, uid)
+    if not message_str then
+        return false
     end
-    new_flags = to_list(new_flags_map)
+    local message = cmsgpack.unpack(message_str)
+    local msg_flags = message['flags']
+    local new_flags = nil
 
-    if has_deleted then
-        redis.call('SADD', deleted_key, uid)
-    end
-    if has_seen then
-        redis.call('ZREM', unseen_key, uid)
-    end
-elseif mode == 'DELETE' and next(flag_set) then
-    local new_flags_map = {}
-    for i, flag in ipairs(msg_flags) do
-        new_flags_map[flag] = true
-    end
-    for i, flag in ipairs(flag_set) do
-        new_flags_map[flag] = nil
-    end
-    new_flags = to_list(new_flags_map)
+    if mode == 'ADD' and next(flag_set) then
+        local new_flags_map = {}
+        for i, flag in ipairs(msg_flags) do
+            new_flags_map[flag] = true
+        end
+        for i, flag in ipairs(flag_set) do
+            new_flags_map[flag] = true
+        end
+        new_flags = to_list(new_flags_map)
 
-    if has_deleted then
-        redis.call('SREM', deleted_key, uid)
-    end
-    if has_seen then
-        redis.call('ZADD', unseen_key, uid, uid)
-    end
-elseif mode == 'REPLACE' then
-    new_flags = flag_set
+        if has_deleted then
+            redis.call('SADD', deleted_key, uid)
+        end
+        if has_seen then
+            redis.call('ZREM', unseen_key, uid)
+        end
+    elseif mode == 'DELETE' and next(flag_set) then
+        local new_flags_map = {}
+        for i, flag in ipairs(msg_flags) do
+            new_flags_map[flag] = true
+        end
+        for i, flag in ipairs(flag_set) do
+            new_flags_map[flag] = nil
+        end
+        new_flags = to_list(new_flags_map)
 
-    if has_deleted then
-        redis.call('SADD', deleted_key, uid)
-    else
-        redis.call('SREM', deleted_key, uid)
-    end
-    if has_seen then
-        redis.call('ZREM', unseen_key, uid)
-    else
-        redis.call('ZADD', unseen_key, uid, uid)
+        if has_deleted then
+            redis.call('SREM', deleted_key, uid)
+        end
+        if has_seen then
+            redis.call('ZADD', unseen_key, uid, uid)
+        end
+    elseif mode == 'REPLACE' then
+        new_flags = flag_set
+
+        if has_deleted then
+            redis.call('SADD', deleted_key, uid)
+        else
+            redis.call('SREM', deleted_key, uid)
+        end
+        if has_seen then
+            redis.call('ZREM', unseen_key, uid)
+        else
+            redis.call('ZADD', unseen_key, uid, uid)
+        end
     end
-end
 
-if new_flags then
-    message['flags'] = new_flags
-    message_str = cmsgpack.pack(message)
+    if new_flags and not same_flags(msg_flags, new_flags) then
+        message['flags'] = new_flags
+        message_str = cmsgpack.pack(message)
+
+        redis.call('HSET', uids_key, uid, message_str)
 
-    redis.call('HSET', uids_key, uid, message_str)
+        local modseq = redis.call('INCR', max_modseq_key)
+        redis.call('XADD', changes_key, 'MAXLEN', '~', 1000, modseq .. '-1',
+            'uid', uid,
+            'type', 'fetch',
+            'message', message_str)
+    end
 
-    local modseq = redis.call('INCR', max_modseq_key)
-    redis.call('XADD', changes_key, 'MAXLEN', '~', 1000, modseq .. '-1',
-        'uid', uid,
-        'type', 'fetch',
-        'message', message_str)
+    return message_str
 end
 
-return message_str
+local ret = {}
+for i, uid in ipairs(uids) do
+    ret[i] = update(uid)
+end
+return ret
@@ -95,18 +95,19 @@ class MessageMove(ScriptBase[int]):
             source_uid, int(recent)])
 
 
-class MessageUpdate(ScriptBase[bytes]):
+class MessageUpdate(ScriptBase[Sequence[Optional[bytes]]]):
 
     def __init__(self) -> None:
         super().__init__('message_update')
 
     async def __call__(self, redis: Redis,
                        ns_keys: NamespaceKeys, mbx_keys: MailboxKeys, *,
-                       uid: int, flags: Sequence[str], mode: bytes) -> bytes:
+                       uids: Sequence[int], flags: Sequence[str],
+                       mode: bytes) -> Sequence[Optional[bytes]]:
         keys = [mbx_keys.uids, mbx_keys.changes, mbx_keys.deleted,
                 mbx_keys.unseen, ns_keys.max_modseq]
         return await self.eval(redis, keys, [
-            uid, mode, self._pack(flags)])
+            self._pack(uids), mode, self._pack(flags)])
 
 
 class MessageDelete(ScriptBase[None]):
@@ -98,6 +98,13 @@ class BaseSession(SessionInterface, Generic[MessageT]):
             -> MailboxDataInterface[MessageT]:
         return await self._get_mailbox(selected.lookup)
 
+    async def _get_destination(self, name: str, selected: SelectedMailbox,
+                               mbx: MailboxDataInterface[MessageT]) \
+            -> MailboxDataInterface[MessageT]:
+        if name == selected.lookup:
+            return mbx
+        return await self._get_mailbox(name, try_create=True)
+
     async def list_mailboxes(self, ref_name: str, filter_: str,
                              subscribed: bool = False,
                              selected: SelectedMailbox = None) \
@@ -117,10 +124,7 @@ class BaseSession(SessionInterface, Generic[MessageT]):
 
     async def get_mailbox(self, name: str, selected: SelectedMailbox = None) \
             -> tuple[MailboxSnapshot, Optional[SelectedMailbox]]:
-        try:
-            mbx = await self.mailbox_set.get_mailbox(name)
-        except KeyError as exc:
-            raise MailboxNotFound(name) from exc
+        mbx = await self._get_mailbox(name)
         snapshot = await mbx.snapshot()
         return snapshot, await self._load_updates(selected, mbx)
 
@@ -171,12 +175,11 @@ class BaseSession(SessionInterface, Generic[MessageT]):
         if mbx.readonly:
             raise MailboxReadOnly(name)
         dest_selected = self._pick_selected(selected, mbx)
-        uids: list[int] = []
-        for append_msg in messages:
-            msg = await mbx.append(append_msg, recent=not dest_selected)
-            if dest_selected:
-                dest_selected.session_flags.add_recent(msg.uid)
-            uids.append(msg.uid)
+        appended = await mbx.append_all(messages, recent=not dest_selected)
+        uids = [msg.uid for msg in appended]
+        if dest_selected:
+            for uid in uids:
+                dest_selected.session_flags.add_recent(uid)
         return (AppendUid(mbx.uid_validity, uids),
                 await self._load_updates(selected, mbx))
 
@@ -205,15 +208,18 @@ class BaseSession(SessionInterface, Generic[MessageT]):
                              sequence_set: SequenceSet, set_seen: bool) \
             -> tuple[Iterable[tuple[int, MessageT]], SelectedMailbox]:
         mbx = await self._get_selected(selected)
+        cached = list(selected.messages.get_all(sequence_set))
         ret: list[tuple[int, MessageT]] = []
-        for seq, cached_msg in selected.messages.get_all(sequence_set):
-            if set_seen:
-                msg = await mbx.update(cached_msg.uid, cached_msg,
-                                       frozenset({Seen}), FlagOp.ADD)
-            else:
+        if set_seen:
+            updated = await mbx.update_all(
+                (cached_msg for _, cached_msg in cached),
+                frozenset({Seen}), FlagOp.ADD)
+            ret.extend((seq, msg) for (seq, _), msg in zip(cached, updated))
+        else:
+            for seq, cached_msg in cached:
                 msg = await mbx.get(cached_msg.uid, cached_msg)
-            if msg is not None:
-                ret.append((seq, msg))
+                if msg is not None:
+                    ret.append((seq, msg))
         return ret, await mbx.update_selected(selected)
 
     async def search_mailbox(self, selected: SelectedMailbox,
@@ -247,18 +253,16 @@ class BaseSession(SessionInterface, Generic[MessageT]):
                             mailbox: str) \
             -> tuple[Optional[CopyUid], SelectedMailbox]:
         mbx = await self._get_selected(selected)
-        dest = await self._get_mailbox(mailbox, try_create=True)
+        dest = await self._get_destination(mailbox, selected, mbx)
         if dest.readonly:
             raise MailboxReadOnly(mailbox)
         dest_selected = self._pick_selected(selected, dest)
-        uids: list[tuple[int, int]] = []
-        for _, source_uid in selected.messages.get_uids(sequence_set):
-            dest_uid = await mbx.copy(source_uid, dest,
-                                      recent=not dest_selected)
-            if dest_uid is not None:
-                if dest_selected:
-                    dest_selected.session_flags.add_recent(dest_uid)
-                uids.append((source_uid, dest_uid))
+        source_uids = (uid for _, uid in
+                       selected.messages.get_uids(sequence_set))
+        uids = await mbx.copy_all(source_uids, dest, recent=not dest_selected)
+        if dest_selected:
+            for _, dest_uid in uids:
+                dest_selected.session_flags.add_recent(dest_uid)
         if not uids:
             copy_uid: Optional[CopyUid] = None
         else:
@@ -270,18 +274,16 @@ class BaseSession(SessionInterface, Generic[MessageT]):
                             mailbox: str) \
             -> tuple[Optional[CopyUid], SelectedMailbox]:
         mbx = await self._get_selected(selected)
-        dest = await self._get_mailbox(mailbox, try_create=True)
+        dest = await self._get_destination(mailbox, selected, mbx)
         if dest.readonly:
             raise MailboxReadOnly(mailbox)
         dest_selected = self._pick_selected(selected, dest)
-        uids: list[tuple[int, int]] = []
-        for _, source_uid in selected.messages.get_uids(sequence_set):
-            dest_uid = await mbx.move(source_uid, dest,
-                                      recent=not dest_selected)
-            if dest_uid is not None:
-                if dest_selected:
-                    dest_selected.session_flags.add_recent(dest_uid)
-                uids.append((source_uid, dest_uid))
+        source_uids = (uid for _, uid in
+                       selected.messages.get_uids(sequence_set))
+        uids = await mbx.move_all(source_uids, dest, recent=not dest_selected)
+        if dest_selected:
+            for _, dest_uid in uids:
+                dest_selected.session_flags.add_recent(dest_uid)
         if not uids:
             copy_uid: Optional[CopyUid] = None
         else:
@@ -297,11 +299,11 @@ class BaseSession(SessionInterface, Generic[MessageT]):
             raise MailboxReadOnly()
         mbx = await self._get_selected(selected)
         permanent_flags = selected.permanent_flags & flag_set
-        messages: list[tuple[int, MessageT]] = []
-        for seq, cached_msg in selected.messages.get_all(sequence_set):
-            uid = cached_msg.uid
-            msg = await mbx.update(uid, cached_msg, permanent_flags, mode)
-            if not msg.expunged:
-                selected.session_flags.update(uid, flag_set, mode)
-            messages.append((seq, msg))
+        cached = list(selected.messages.get_all(sequence_set))
+        updated = await mbx.update_all(
+            (cached_msg for _, cached_msg in cached), permanent_flags, mode)
+        messages = [(seq, msg) for (seq, _), msg in zip(cached, updated)]
+        selected.session_flags.update_all(
+            (msg.uid for _, msg in messages if not msg.expunged),
+            flag_set, mode)
         return messages, await mbx.update_selected(selected)
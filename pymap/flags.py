@@ -35,6 +35,8 @@ class FlagOp(enum.Enum):
     def apply(self, flag_set: Set[Flag], operand: Set[Flag]) \
             -> frozenset[Flag]:
         """Apply the flag operation on the two sets, returning the result.
+        If the operation would not change ``flag_set``, it is returned as-is
+        to avoid building an equal copy.
 
         Args:
             flag_set: The flag set being operated on.
@@ -42,8 +44,12 @@ class FlagOp(enum.Enum):
 
         """
         if self == FlagOp.ADD:
+            if operand <= flag_set:
+                return frozenset(flag_set)
             return frozenset(flag_set | operand)
         elif self == FlagOp.DELETE:
+            if flag_set.isdisjoint(operand):
+                return frozenset(flag_set)
             return frozenset(flag_set - operand)
         else:  # op == FlagOp.REPLACE
             return frozenset(operand)
@@ -173,8 +179,28 @@ class SessionFlags:
             op: The type of update.
 
         """
+        return self._update(uid, self & flag_set, op)
+
+    def update_all(self, uids: Iterable[int], flag_set: Iterable[Flag],
+                   op: FlagOp = FlagOp.REPLACE) -> None:
+        """Update the flags for the session on all the given messages.
+
+        Args:
+            uids: The message UID values.
+            flag_set: The set of flags for the update operation.
+            op: The type of update.
+
+        """
+        session_flag_set = self & flag_set
+        if not session_flag_set and op != FlagOp.REPLACE:
+            return
+        for uid in uids:
+            self._update(uid, session_flag_set, op)
+
+    def _update(self, uid: int, flag_set: frozenset[Flag],
+                op: FlagOp) -> frozenset[Flag]:
         orig_set = self._flags.get(uid, frozenset())
-        new_flags = op.apply(orig_set, self & flag_set)
+        new_flags = op.apply(orig_set, flag_set)
         if new_flags:
             self._flags[uid] = new_flags
         else:
@@ -289,8 +289,7 @@ class ConnectionState:
     async def do_fetch(self, cmd: FetchCommand) -> _CommandRet:
         if not cmd.uid:
             self.selected.hide_expunged = True
-        set_seen = not self.selected.readonly and \
-            any(attr.set_seen for attr in cmd.attributes)
+        set_seen = not self.selected.readonly and cmd.set_seen
         messages, updates = await self.session.fetch_messages(
             self.selected, cmd.sequence_set, set_seen)
         resp = ResponseOk(cmd.tag, cmd.command + b' completed.')
@@ -4,6 +4,7 @@ from __future__ import annotations
 import re
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from re import Pattern
 from typing import Optional
 
@@ -73,6 +74,24 @@ class _TreeNode:
             child.add(*extra)
 
 
+_wildcards = re.compile(r'([\*\%])')
+
+
+@lru_cache(maxsize=32)
+def _get_pattern(delimiter: str, query: str) -> tuple[Pattern, Pattern]:
+    no_delimiter = '[^' + re.escape(delimiter) + ']*?'
+    pattern_parts: list[str] = []
+    for part in _wildcards.split(query):
+        if part == '*':
+            pattern_parts.append('.*?')
+        elif part == '%':
+            pattern_parts.append(no_delimiter)
+        else:
+            pattern_parts.append(re.escape(part))
+    pattern = '^' + ''.join(pattern_parts) + '$'
+    return re.compile(pattern), re.compile(pattern, re.IGNORECASE)
+
+
 class ListTree:
     """Constructs a tree of hierarchical mailbox names. If a mailbox name
     has superior names in the heirarchy that do not exist, they are added as
@@ -83,14 +102,11 @@ class ListTree:
 
     """
 
-    _wildcards = re.compile(r'([\*\%])')
-
-    __slots__ = ['_delimiter', '_no_delimiter', '_root', '_marked']
+    __slots__ = ['_delimiter', '_root', '_marked']
 
     def __init__(self, delimiter: str) -> None:
         super().__init__()
         self._delimiter = delimiter
-        self._no_delimiter = '[^' + re.escape(delimiter) + ']*?'
         self._root = _TreeNode('')
         self._marked: dict[str, bool] = {}
 
@@ -192,18 +208,6 @@ class ListTree:
         for entry in self._iter(self._root, ''):
             yield entry
 
-    def _get_pattern(self, query: str) -> tuple[Pattern, Pattern]:
-        pattern_parts: list[str] = []
-        for part in self._wildcards.split(query):
-            if part == '*':
-                pattern_parts.append('.*?')
-            elif part == '%':
-                pattern_parts.append(self._no_delimiter)
-            else:
-                pattern_parts.append(re.escape(part))
-        pattern = '^' + ''.join(pattern_parts) + '$'
-        return re.compile(pattern), re.compile(pattern, re.IGNORECASE)
-
     def list_matching(self, ref_name: str, filter_: str) \
             -> Iterable[ListEntry]:
         """Return all the entries in the list tree that match the given query.
@@ -213,7 +217,8 @@ class ListTree:
             filter_: Mailbox name with possible wildcards.
 
         """
-        canonical, canonical_i = self._get_pattern(ref_name + filter_)
+        query = ref_name + filter_
+        canonical, canonical_i = _get_pattern(self._delimiter, query)
         for entry in self.list():
             if entry.name == 'INBOX':
                 if canonical_i.match('INBOX'):
@@ -177,6 +177,7 @@ class FetchCommand(CommandSelect):
         self.sequence_set = seq_set
         self.attributes = attr_list
         self.options = options or ExtensionOptions.empty()
+        self.set_seen = any(attr.set_seen for attr in attr_list)
 
     @classmethod
     def _check_macros(cls, buf: memoryview, params: Params) \
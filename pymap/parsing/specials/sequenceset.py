@@ -74,12 +74,12 @@ class SequenceSet(Parseable[Sequence[_SeqElem]]):
             and first[0] == 1 and isinstance(first[1], MaxValue)
 
     @classmethod
-    def _get_range(cls, elem: _SeqElem, max_value: int) -> Iterable[int]:
+    def _get_range(cls, elem: _SeqElem, max_value: int) -> range:
         if isinstance(elem, int):
             if elem <= max_value:
                 return range(elem, elem + 1)
             else:
-                return ()
+                return range(0)
         elif isinstance(elem, MaxValue):
             return range(max_value, max_value + 1)
         else:
@@ -93,7 +93,7 @@ class SequenceSet(Parseable[Sequence[_SeqElem]]):
                 high = min(max(left, right), max_value)
                 return range(low, high + 1)
             else:
-                return ()
+                return range(0)
 
     def flatten(self, max_value: int) -> frozenset[int]:
         """Return a set of all values contained in the sequence set.
@@ -112,8 +112,22 @@ class SequenceSet(Parseable[Sequence[_SeqElem]]):
             max_value: The maximum value of the set.
 
         """
-        return chain.from_iterable(
-            (self._get_range(elem, max_value) for elem in self.sequences))
+        return chain.from_iterable(self.ranges(max_value))
+
+    def ranges(self, max_value: int) -> Iterator[range]:
+        """Iterates through the non-empty ranges of values in the set,
+        bounded by the given maximum value (in place of any ``*``). Unlike
+        :meth:`.iter`, the ranges are not expanded, so this may be used to
+        look up values without visiting every number in the set.
+
+        Args:
+            max_value: The maximum value of the set.
+
+        """
+        for elem in self.sequences:
+            elem_range = self._get_range(elem, max_value)
+            if elem_range:
+                yield elem_range
 
     def _elem_bytes(self, elem: _SeqIdx) -> bytes:
         if isinstance(elem, MaxValue):
@@ -228,6 +242,10 @@ class _AllSequenceSet(SequenceSet):
     def iter(self, max_value: int) -> Iterator[int]:
         return iter(range(1, max_value + 1))
 
+    def ranges(self, max_value: int) -> Iterator[range]:
+        if max_value > 0:
+            yield range(1, max_value + 1)
+
     def __bytes__(self) -> bytes:
         return b'1:*'
 
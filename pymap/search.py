@@ -6,6 +6,7 @@ import re
 from abc import abstractmethod, ABCMeta
 from collections.abc import Iterable
 from datetime import datetime
+from re import Pattern
 from typing import AnyStr, Optional, Final
 
 from .exceptions import SearchNotAllowed
@@ -53,11 +54,13 @@ class SearchCriteria(metaclass=ABCMeta):
     def __init__(self, params: SearchParams) -> None:
         self.params = params
 
+    @classmethod
+    def _compile(cls, substr: AnyStr) -> Pattern[AnyStr]:
+        return re.compile(re.escape(substr), re.I | re.A)
+
     @classmethod
     def _in(cls, substr: AnyStr, data: AnyStr) -> bool:
-        re_flags = re.I | re.A
-        escaped_substr = re.escape(substr)
-        return re.search(escaped_substr, data, re_flags) is not None
+        return cls._compile(substr).search(data) is not None
 
     @abstractmethod
     def matches(self, msg_seq: int, msg: MessageInterface,
@@ -169,7 +172,9 @@ class SearchCriteriaSet(SearchCriteria):
     def __init__(self, keys: frozenset[SearchKey],
                  params: SearchParams) -> None:
         super().__init__(params)
-        self.all_criteria = [SearchCriteria.of(key, params) for key in keys]
+        ordered_keys = sorted(keys, key=lambda key: key.requirement.value)
+        self.all_criteria = [SearchCriteria.of(key, params)
+                             for key in ordered_keys]
 
     @property
     def sequence_set(self) -> SequenceSet:
@@ -384,31 +389,32 @@ class EnvelopeSearchCriteria(SearchCriteria):
         super().__init__(params)
         self.key = key
         self.value = value
+        self.pattern = self._compile(value)
 
     def matches(self, msg_seq: int, msg: MessageInterface,
                 loaded_msg: LoadedMessageInterface) -> bool:
         envelope = loaded_msg.get_envelope_structure()
+        search = self.pattern.search
         if self.key == b'BCC':
             if not envelope.bcc:
                 return False
-            return any(self._in(self.value, str(bcc)) for bcc in envelope.bcc)
+            return any(search(str(bcc)) for bcc in envelope.bcc)
         elif self.key == b'CC':
             if not envelope.cc:
                 return False
-            return any(self._in(self.value, str(cc)) for cc in envelope.cc)
+            return any(search(str(cc)) for cc in envelope.cc)
         elif self.key == b'FROM':
             if not envelope.from_:
                 return False
-            return any(self._in(self.value, str(from_))
-                       for from_ in envelope.from_)
+            return any(search(str(from_)) for from_ in envelope.from_)
         elif self.key == b'SUBJECT':
             if not envelope.subject:
                 return False
-            return self._in(self.value, str(envelope.subject))
+            return search(str(envelope.subject)) is not None
         elif self.key == b'TO':
             if not envelope.to:
                 return False
-            return any(self._in(self.value, str(to)) for to in envelope.to)
+            return any(search(str(to)) for to in envelope.to)
         raise ValueError(self.key)
 
 
@@ -419,11 +425,13 @@ class HeaderSearchCriteria(SearchCriteria):
         super().__init__(params)
         self.name = name.encode('ascii')
         self.value = value
+        self.pattern = self._compile(value)
 
     def matches(self, msg_seq: int, msg: MessageInterface,
                 loaded_msg: LoadedMessageInterface) -> bool:
         values = loaded_msg.get_header(self.name)
-        return any(self._in(self.value, value) for value in values)
+        search = self.pattern.search
+        return any(search(value) for value in values)
 
 
 class BodySearchCriteria(SearchCriteria):
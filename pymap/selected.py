@@ -1,9 +1,9 @@
 
 from __future__ import annotations
 
-from bisect import bisect_right
+from bisect import bisect_left, bisect_right
 from collections.abc import Iterable, MutableSet, Sequence, Set
-from itertools import chain, groupby, islice
+from itertools import chain, count, groupby, islice
 from typing import Any, Optional
 from weakref import WeakSet
 
@@ -66,6 +66,9 @@ class SelectedSet:
 
 class _Frozen:
 
+    __slots__ = ['is_deleted', 'uids', 'seqs_cache', 'flags', 'recent',
+                 'sflags']
+
     def __init__(self, selected: SelectedMailbox) -> None:
         super().__init__()
         messages = selected.messages
@@ -81,6 +84,9 @@ class _Frozen:
 class SynchronizedMessages:
     """Manages the message data that has been synchronized with the client."""
 
+    __slots__ = ['_uids', '_sorted', '_seqs_cache', '_cache',
+                 '_flags_key_map', '_flags_key_set', '_pending_remove']
+
     def __init__(self) -> None:
         super().__init__()
         self._uids: set[int] = set()
@@ -105,26 +111,35 @@ class SynchronizedMessages:
             return 0
 
     def _update(self, messages: Iterable[CachedMessage]) -> None:
-        lowest_idx: Optional[int] = None
+        uids = self._uids
+        cache = self._cache
+        flags_key_map = self._flags_key_map
+        flags_key_set = self._flags_key_set
+        new_uids: list[int] = []
         for msg in messages:
             msg_uid = msg.uid
-            if msg_uid not in self._uids:
-                self._uids.add(msg_uid)
-                idx = bisect_right(self._sorted, msg_uid)
-                if lowest_idx is None or lowest_idx > idx:
-                    lowest_idx = idx
-                self._sorted.insert(idx, msg_uid)
-            self._cache[msg_uid] = msg
+            if msg_uid not in uids:
+                uids.add(msg_uid)
+                new_uids.append(msg_uid)
+            cache[msg_uid] = msg
             new_flags_key = msg.flags_key
-            old_flags_key = self._flags_key_map.get(msg_uid)
+            old_flags_key = flags_key_map.get(msg_uid)
             if old_flags_key is not None:
-                self._flags_key_set.discard(old_flags_key)
-            self._flags_key_map[msg_uid] = new_flags_key
-            self._flags_key_set.add(new_flags_key)
-        if lowest_idx is not None:
-            needs_reset = islice(self._sorted, lowest_idx, len(self._sorted))
-            for seq, uid in enumerate(needs_reset, lowest_idx + 1):
-                self._seqs_cache[uid] = seq
+                flags_key_set.discard(old_flags_key)
+            flags_key_map[msg_uid] = new_flags_key
+            flags_key_set.add(new_flags_key)
+        if new_uids:
+            new_uids.sort()
+            sorted_uids = self._sorted
+            lowest_idx = bisect_right(sorted_uids, new_uids[0])
+            if lowest_idx == len(sorted_uids):
+                sorted_uids.extend(new_uids)
+            else:
+                sorted_uids[lowest_idx:] = sorted(
+                    chain(islice(sorted_uids, lowest_idx, None), new_uids))
+            needs_reset = islice(sorted_uids, lowest_idx, None)
+            self._seqs_cache.update(
+                zip(needs_reset, count(lowest_idx + 1)))
 
     def _remove(self, uids: Iterable[int], pending: bool) -> None:
         if pending:
@@ -157,6 +172,20 @@ class SynchronizedMessages:
         """
         return self._cache.get(uid)
 
+    def _get_indexes(self, seq_set: SequenceSet) -> Iterable[int]:
+        sorted_uids = self._sorted
+        if seq_set.uid:
+            idx_ranges = [range(bisect_left(sorted_uids, uid_range.start),
+                                bisect_left(sorted_uids, uid_range.stop))
+                          for uid_range in seq_set.ranges(self.max_uid)]
+        else:
+            idx_ranges = [range(max(seq_range.start, 1) - 1,
+                                seq_range.stop - 1)
+                          for seq_range in seq_set.ranges(self.exists)]
+        if len(idx_ranges) == 1:
+            return idx_ranges[0]
+        return sorted(set(chain.from_iterable(idx_ranges)))
+
     def get_uids(self, seq_set: SequenceSet) -> Sequence[tuple[int, int]]:
         """Return the message sequence numbers and their UIDs for the given
         sequence set.
@@ -165,14 +194,9 @@ class SynchronizedMessages:
             seq_set: The message sequence set.
 
         """
-        if seq_set.uid:
-            all_uids = seq_set.flatten(self.max_uid) & self._uids
-            return [(seq, uid) for seq, uid in enumerate(self._sorted, 1)
-                    if uid in all_uids]
-        else:
-            all_seqs = seq_set.flatten(self.exists)
-            return [(seq, uid) for seq, uid in enumerate(self._sorted, 1)
-                    if seq in all_seqs]
+        sorted_uids = self._sorted
+        return [(idx + 1, sorted_uids[idx])
+                for idx in self._get_indexes(seq_set)]
 
     def get_all(self, seq_set: SequenceSet) \
             -> Sequence[tuple[int, CachedMessage]]:
@@ -183,16 +207,10 @@ class SynchronizedMessages:
             seq_set: The message sequence set.
 
         """
-        if seq_set.uid:
-            all_uids = seq_set.flatten(self.max_uid) & self._uids
-            return [(seq, self._cache[uid])
-                    for seq, uid in enumerate(self._sorted, 1)
-                    if uid in all_uids]
-        else:
-            all_seqs = seq_set.flatten(self.exists)
-            return [(seq, self._cache[uid])
-                    for seq, uid in enumerate(self._sorted, 1)
-                    if seq in all_seqs]
+        sorted_uids = self._sorted
+        cache = self._cache
+        return [(idx + 1, cache[sorted_uids[idx]])
+                for idx in self._get_indexes(seq_set)]
 
 
 class SelectedMailbox:
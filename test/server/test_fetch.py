@@ -1,6 +1,12 @@
 
 import pytest
 
+from pymap.backend.dict import Identity
+from pymap.backend.dict.mailbox import Message
+from pymap.flags import FlagOp
+from pymap.parsing.specials import SequenceSet
+from pymap.parsing.specials.flag import Seen
+
 from .base import TestBase
 
 pytestmark = pytest.mark.asyncio
@@ -106,6 +112,20 @@ class TestFetch(TestBase):
         transport.push_logout()
         await self.run(transport)
 
+    async def test_fetch_stale_seen(self, backend):
+        identity = Identity('testuser', backend.login, None)
+        async with identity.new_session() as session:
+            _, selected = await session.select_mailbox('INBOX')
+            mbx = await session.mailbox_set.get_mailbox('INBOX')
+            seq_set = SequenceSet.build([1])
+            (_, msg), = selected.messages.get_all(seq_set)
+            # Other backends cache copies, which may be stale.
+            selected.add_updates([Message.copy(msg)], [])
+            await mbx.update(msg.uid, msg, frozenset({Seen}), FlagOp.DELETE)
+            assert Seen not in msg.permanent_flags
+            await session.fetch_messages(selected, seq_set, True)
+            assert Seen in msg.permanent_flags
+
     async def test_fetch_rfc822_header(self, imap_server):
         transport = self.new_transport(imap_server)
         transport.push_login()
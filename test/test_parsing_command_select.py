@@ -69,6 +69,12 @@ class TestFetchCommand(unittest.TestCase):
         self.assertListEqual([FetchAttribute(b'ENVELOPE')], ret.attributes)
         self.assertEqual(b'  ', buf)
 
+    def test_parse_set_seen(self):
+        ret, _ = FetchCommand.parse(b' 1 (FLAGS BODY.PEEK[])\n', Params())
+        self.assertFalse(ret.set_seen)
+        ret, _ = FetchCommand.parse(b' 1 (FLAGS BODY[])\n', Params())
+        self.assertTrue(ret.set_seen)
+
     def test_parse_uid(self):
         ret, buf = UidFetchCommand.parse(b' 1,2,3 ENVELOPE\n  ', Params())
         self.assertTrue(ret.uid)
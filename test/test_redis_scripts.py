@@ -0,0 +1,107 @@
+import os.path
+import unittest
+from typing import Any
+
+import pytest
+
+lupa = pytest.importorskip('lupa')
+msgpack = pytest.importorskip('msgpack')
+
+_lua_dir = os.path.join(os.path.dirname(__file__), '..', 'pymap', 'backend',
+                        'redis', 'scripts', 'lua')
+
+
+class _FakeRedis:
+
+    def __init__(self, runtime: Any) -> None:
+        super().__init__()
+        self.runtime = runtime
+        self.hashes: dict[bytes, dict[bytes, bytes]] = {}
+        self.counters: dict[bytes, int] = {}
+        self.commands: list[bytes] = []
+
+    @classmethod
+    def _bytes(cls, val: Any) -> bytes:
+        return val if isinstance(val, bytes) else str(val).encode('ascii')
+
+    def call(self, cmd: bytes, key: bytes, *args: Any) -> Any:
+        self.commands.append(cmd)
+        if cmd == b'HGET':
+            return self.hashes.get(key, {}).get(self._bytes(args[0]), False)
+        elif cmd == b'HSET':
+            field, value = args
+            self.hashes.setdefault(key, {})[self._bytes(field)] = value
+        elif cmd == b'INCR':
+            self.counters[key] = self.counters.get(key, 0) + 1
+            return self.counters[key]
+        return 1
+
+    def pack(self, table: Any) -> bytes:
+        return msgpack.packb(self._from_lua(table))
+
+    def unpack(self, data: bytes) -> Any:
+        return self.runtime.table_from(
+            msgpack.unpackb(data, raw=True), recursive=True)
+
+    def _from_lua(self, val: Any) -> Any:
+        if lupa.lua_type(val) != 'table':
+            return val
+        keys = list(val.keys())
+        if keys == list(range(1, len(keys) + 1)):
+            return [self._from_lua(val[key]) for key in keys]
+        return {key: self._from_lua(val[key]) for key in keys}
+
+
+class TestMessageUpdate(unittest.TestCase):
+
+    def setUp(self) -> None:
+        with open(os.path.join(_lua_dir, 'message_update.lua'), 'rb') as f:
+            self.script = f.read()
+        self.runtime = lupa.LuaRuntime(encoding=None)
+        self.redis = redis = _FakeRedis(self.runtime)
+        lua_globals = self.runtime.globals()
+        lua_globals.redis = self.runtime.table_from({b'call': redis.call})
+        lua_globals.cmsgpack = self.runtime.table_from(
+            {b'pack': redis.pack, b'unpack': redis.unpack})
+        lua_globals.KEYS = self.runtime.table(
+            b'uids', b'changes', b'deleted', b'unseen', b'max_modseq')
+        redis.hashes[b'uids'] = {
+            b'1': msgpack.packb({'flags': ['\\Seen']}),
+            b'2': msgpack.packb({'flags': []})}
+
+    def _run(self, uids: list[int], mode: bytes,
+             flags: list[str]) -> list[Any]:
+        self.runtime.globals().ARGV = self.runtime.table(
+            msgpack.packb(uids), mode, msgpack.packb(flags))
+        ret = self.runtime.execute(self.script)
+        return [ret[i] for i in range(1, len(uids) + 1)]
+
+    def _flags(self, uid: bytes) -> list[bytes]:
+        message = msgpack.unpackb(self.redis.hashes[b'uids'][uid], raw=True)
+        return sorted(message[b'flags'])
+
+    def test_update(self) -> None:
+        ret = self._run([2], b'ADD', ['\\Seen'])
+        self.assertEqual([b'\\Seen'], self._flags(b'2'))
+        self.assertEqual([self.redis.hashes[b'uids'][b'2']], ret)
+        self.assertIn(b'HSET', self.redis.commands)
+        self.assertIn(b'XADD', self.redis.commands)
+        self.assertEqual({b'max_modseq': 1}, self.redis.counters)
+
+    def test_update_unchanged(self) -> None:
+        original = self.redis.hashes[b'uids'][b'1']
+        ret = self._run([1], b'ADD', ['\\Seen'])
+        self.assertEqual([original], ret)
+        self.assertNotIn(b'HSET', self.redis.commands)
+        self.assertNotIn(b'XADD', self.redis.commands)
+        self.assertEqual({}, self.redis.counters)
+        self._run([2], b'REPLACE', [])
+        self.assertNotIn(b'HSET', self.redis.commands)
+        self.assertEqual({}, self.redis.counters)
+
+    def test_update_multiple(self) -> None:
+        ret = self._run([1, 3, 2], b'DELETE', ['\\Seen'])
+        self.assertEqual(False, ret[1])
+        self.assertEqual([], self._flags(b'1'))
+        self.assertEqual([], self._flags(b'2'))
+        self.assertEqual({b'max_modseq': 1}, self.redis.counters)
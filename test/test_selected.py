@@ -8,6 +8,7 @@ from pymap.parsing.command.select import SearchCommand, UidSearchCommand
 from pymap.parsing.response import ResponseOk
 from pymap.parsing.specials import SequenceSet, ObjectId
 from pymap.parsing.specials.flag import Seen, Flagged, Flag
+from pymap.parsing.specials.sequenceset import MaxValue
 from pymap.selected import SelectedMailbox
 
 _Keyword = Flag(b'$Keyword')
@@ -227,3 +228,59 @@ class TestSelectedMailbox(unittest.TestCase):
         self.response.add_untagged(*untagged)
         self.assertEqual(b'* BYE Selected mailbox no longer exists.\r\n'
                          b'. OK testing\r\n', bytes(self.response))
+
+    def test_get_uids_empty(self) -> None:
+        selected = self.new_selected()
+        messages = selected.messages
+        self.assertEqual([], messages.get_uids(SequenceSet.all(uid=True)))
+        self.assertEqual([], messages.get_uids(
+            SequenceSet([MaxValue()], uid=True)))
+        self.assertEqual([], messages.get_uids(SequenceSet.all()))
+        self.assertEqual([], messages.get_uids(SequenceSet([MaxValue()])))
+
+    def test_get_uids_uid(self) -> None:
+        selected = self.new_selected()
+        self.set_messages(selected, [],
+                          [(101, []), (102, []), (105, []), (110, [])])
+        messages = selected.messages
+        self.assertEqual([(4, 110)], messages.get_uids(
+            SequenceSet([MaxValue()], uid=True)))
+        self.assertEqual([(4, 110)], messages.get_uids(
+            SequenceSet([(200, MaxValue())], uid=True)))
+        self.assertEqual([(2, 102), (3, 105)], messages.get_uids(
+            SequenceSet([(102, 104), (103, 105)], uid=True)))
+        self.assertEqual([(2, 102), (3, 105), (4, 110)], messages.get_uids(
+            SequenceSet([(110, 102)], uid=True)))
+        self.assertEqual([(1, 101), (4, 110)], messages.get_uids(
+            SequenceSet([110, 1, 101, 103], uid=True)))
+
+    def test_get_uids_seq(self) -> None:
+        selected = self.new_selected()
+        self.set_messages(selected, [],
+                          [(101, []), (102, []), (105, []), (110, [])])
+        messages = selected.messages
+        self.assertEqual([(4, 110)], messages.get_uids(
+            SequenceSet([MaxValue()])))
+        self.assertEqual([(1, 101), (2, 102), (3, 105), (4, 110)],
+                         messages.get_uids(SequenceSet([(1, 5), (3, 8)])))
+        self.assertEqual([(2, 102), (3, 105)], messages.get_uids(
+            SequenceSet([(3, 2)])))
+        self.assertEqual([(1, 101), (3, 105)], messages.get_uids(
+            SequenceSet([3, 1, 3, 9])))
+
+    def test_get_uids_removed(self) -> None:
+        selected = self.new_selected()
+        self.set_messages(selected, [],
+                          [(101, []), (102, []), (105, []), (110, [])])
+        self.set_messages(selected, [102], [])
+        messages = selected.messages
+        self.assertEqual([(2, 105)], messages.get_uids(SequenceSet([2])))
+        self.assertEqual([(3, 110)], messages.get_uids(
+            SequenceSet([MaxValue()])))
+        self.assertEqual([(2, 105)], messages.get_uids(
+            SequenceSet([(102, 105)], uid=True)))
+        self.assertEqual([(1, 101), (3, 110)], messages.get_uids(
+            SequenceSet([101, 102, 110], uid=True)))
+        self.assertEqual([(3, 110)], [
+            (seq, msg.uid) for seq, msg in messages.get_all(
+                SequenceSet([(4, MaxValue())]))])
@@ -57,6 +57,14 @@ class TestSequenceSet(unittest.TestCase):
         set11 = SequenceSet([(1000, 1000)])
         self.assertEqual([], list(set11.flatten(100)))
 
+    def test_ranges(self) -> None:
+        set1 = SequenceSet([(1, 2), 1000, (MaxValue(), 50)])
+        self.assertEqual([range(1, 3), range(50, 101)],
+                         list(set1.ranges(100)))
+        set2 = SequenceSet.all()
+        self.assertEqual([range(1, 101)], list(set2.ranges(100)))
+        self.assertEqual([], list(set2.ranges(0)))
+
     def test_bytes(self) -> None:
         seq = SequenceSet([12, MaxValue(), (1, MaxValue())])
         self.assertEqual(b'12,*,1:*', bytes(seq))